@@ -1,7 +1,8 @@
 import numpy as np
 import logging
 import spacy
-import string
+from spacy.language import Language
+from spacy.tokens import Doc
 from typing import Any, Text, Dict, List, Type
 
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe
@@ -19,7 +20,7 @@ from rasa.nlu.constants import (
 from rasa.shared.nlu.constants import TEXT, FEATURE_TYPE_SENTENCE
 from rasa.utils.tensorflow.constants import POOLING, MEAN_POOLING
 
-from .syntactic_deps import deps, allowed_deps, precomputed_deps
+from .syntactic_deps import deps, allowed_deps, encode_deps, find_precomputed_deps, has_precomputed_deps
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +49,17 @@ class SyntacticFeaturizer(DenseFeaturizer, GraphComponent):
         super().__init__(name, config)
         self.pooling_operation = self._config[POOLING]
 
-        # Initialize spaCy model used for syntactic-semantic parsing
-        self.nlp_spacy = spacy.load('./models/spacy-syntactic')
+        # spaCy model used to tokenize the messages, loaded on first use
+        self._nlp_spacy = None
+
+    @property
+    def nlp_spacy(self) -> Language:
+        """ Load the spaCy model when the first messages are processed. """
+
+        if self._nlp_spacy is None:
+            # the labels come from the manual annotations, only the tokenizer is used
+            self._nlp_spacy = spacy.load('./models/spacy-syntactic', disable=["tagger", "parser", "ner"])
+        return self._nlp_spacy
 
     @classmethod
     def create(
@@ -64,8 +74,12 @@ class SyntacticFeaturizer(DenseFeaturizer, GraphComponent):
 
     def process(self, messages: List[Message]) -> List[Message]:
         """Processes incoming messages and computes and sets features."""
-        for message in messages:
-            self._set_features(message, TEXT)
+        # tokenize the texts in batches, which is considerably faster than one by one
+        # (blank texts have no tokens to featurize)
+        messages_to_featurize = [message for message in messages if (message.get(TEXT) or "").strip()]
+        docs = self.nlp_spacy.pipe((message.get(TEXT).lower() for message in messages_to_featurize), batch_size=64)
+        for message, doc in zip(messages_to_featurize, docs):
+            self._set_features(message, doc, TEXT)
         return messages
 
     def process_training_data(self, training_data: TrainingData) -> TrainingData:
@@ -80,31 +94,28 @@ class SyntacticFeaturizer(DenseFeaturizer, GraphComponent):
         self.process(training_data.training_examples)
         return training_data
 
-    def _set_features(self, message: Message, attribute: Text = TEXT) -> None:
+    def _set_features(self, message: Message, doc: Doc, attribute: Text = TEXT) -> None:
         """Adds the spacy word vectors to the messages features."""
         text = message.get(TEXT)
-        if not text:
-            return
 
-        pre_deps = precomputed_deps[text] if text in precomputed_deps else None
-        if not pre_deps:
+        if not has_precomputed_deps(text):
             raise Exception(f"No manually annotated syntactic features were defined for sentence <{text}>")
 
-        doc = self.nlp_spacy(text.lower())
-        word_syntactic_deps = []
-        for i, spacy_token in enumerate(doc):
-            no_spec_chars = spacy_token.text.translate(str.maketrans('', '', string.punctuation))
-            # word_syntactic_deps.append(spacy_token.dep_ if no_spec_chars and spacy_token.dep_ in deps else '-')
-            word_syntactic_deps.append(pre_deps[i] if pre_deps else '-')
+        pre_deps = find_precomputed_deps(text, len(doc))
+        if pre_deps is None:
+            raise Exception(
+                f"The manually annotated syntactic features of sentence <{text}> "
+                f"do not cover all of its {len(doc)} tokens"
+            )
 
         """Feature vector for a single document / sentence / tokens."""
-        a = np.array([deps.index(t) for t in word_syntactic_deps])
+        a = encode_deps(pre_deps)[:len(doc)]
         sequence_features = np.zeros((a.size, len(deps)))
         sequence_features[np.arange(a.size), a] = 1
         sequence_features[:, 0] = 0
 
         sentence_features = self.aggregate_sequence_features(sequence_features, self.pooling_operation)
-        # print(text, sentence_features)
+        logger.debug("Syntactic sentence features of <%s>: %s", text, sentence_features)
 
         final_sentence_features = Features(
             sentence_features,
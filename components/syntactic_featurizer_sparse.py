@@ -2,9 +2,8 @@ from __future__ import annotations
 from collections import OrderedDict
 import logging
 import scipy.sparse
-import spacy
-import string
 import numpy as np
+from pathlib import Path
 from typing import Any, Dict, Text, List, Tuple, Callable, Set, Optional, Type, Union
 
 from rasa.engine.graph import ExecutionContext, GraphComponent
@@ -22,7 +21,7 @@ from rasa.shared.exceptions import InvalidConfigException
 import rasa.shared.utils.io
 import rasa.utils.io
 
-from .syntactic_deps import deps, allowed_deps, precomputed_deps
+from .syntactic_deps import deps, allowed_deps, encode_deps, find_precomputed_deps, has_precomputed_deps
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +62,7 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
     """
 
     FILENAME_FEATURE_TO_IDX_DICT = "synt_feature_to_idx_dict.pkl"
+    FILENAME_FEATURE_TO_IDX_ARRAYS = "synt_feature_to_idx_dict.npz"
 
     # NOTE: "suffix5" of the token "is" will be "is". Hence, when combining multiple
     # prefixes, short words will be represented/encoded repeatedly.
@@ -73,6 +73,18 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
     SUPPORTED_FEATURES = sorted(
         set(_FUNCTION_DICT.keys()).union([END_OF_SENTENCE, BEGIN_OF_SENTENCE])
     )
+    _SUPPORTED_FEATURES_SET = frozenset(SUPPORTED_FEATURES)
+
+    # every value a supported feature can take, by its integer code
+    _FEATURE_VALUES: Dict[Text, List[Text]] = {
+        "syntactic_dep": deps,
+        BEGIN_OF_SENTENCE: ["False", "True"],
+        END_OF_SENTENCE: ["False", "True"],
+    }
+    _FEATURE_VALUE_CODES: Dict[Text, Dict[Text, int]] = {
+        feature_name: {feature_value: code for code, feature_value in enumerate(feature_values)}
+        for feature_name, feature_values in _FEATURE_VALUES.items()
+    }
 
     @classmethod
     def _extract_raw_features_from_token(
@@ -88,15 +100,17 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         Returns:
           the raw feature value as text
         """
-        if feature_name not in cls.SUPPORTED_FEATURES:
+        if feature_name not in cls._SUPPORTED_FEATURES_SET:
             raise InvalidConfigException(
                 f"Configured feature '{feature_name}' not valid. Please check "
                 f"'{DOCS_URL_COMPONENTS}' for valid configuration parameters."
             )
         if feature_name == END_OF_SENTENCE:
-            return str(token_position == num_tokens - 1)
+            return "True" if token_position == num_tokens - 1 else "False"
         if feature_name == BEGIN_OF_SENTENCE:
-            return str(token_position == 0)
+            return "True" if token_position == 0 else "False"
+        if feature_name == "syntactic_dep":
+            return token.text
         return str(cls._FUNCTION_DICT[feature_name](token))
 
     @classmethod
@@ -104,15 +118,20 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         """Components that should be included in the pipeline before this component."""
         return [Tokenizer]
 
-    @staticmethod
-    def get_default_config() -> Dict[Text, Any]:
+    _DEFAULT_CONFIG: Optional[Dict[Text, Any]] = None
+
+    @classmethod
+    def get_default_config(cls) -> Dict[Text, Any]:
         """Returns the component's default config."""
-        return {
-            **SparseFeaturizer.get_default_config(),
-            FEATURES: [
-                ["syntactic_dep"]
-            ],
-        }
+        if cls._DEFAULT_CONFIG is None:
+            cls._DEFAULT_CONFIG = {
+                **SparseFeaturizer.get_default_config(),
+                FEATURES: [
+                    ["syntactic_dep"]
+                ],
+            }
+        # a shallow copy suffices, the configured features are never modified in-place
+        return dict(cls._DEFAULT_CONFIG)
 
     def __init__(
             self,
@@ -134,9 +153,6 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
             feature_to_idx_dict or {}, check_consistency_with_config=True
         )
 
-        # Initialize spaCy model used for syntactic-semantic parsing
-        self.nlp_spacy = spacy.load('./models/spacy-syntactic')
-
     @classmethod
     def validate_config(cls, config: Dict[Text, Any]) -> None:
         """Validates that the component is configured properly."""
@@ -157,7 +173,7 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
             )
         except TypeError as e:
             raise InvalidConfigException(message) from e
-        if configured_feature_names.difference(cls.SUPPORTED_FEATURES):
+        if not configured_feature_names.issubset(cls._SUPPORTED_FEATURES_SET):
             raise InvalidConfigException(message)
 
     def _set_feature_to_idx_dict(
@@ -178,20 +194,15 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         """
         self._feature_to_idx_dict = feature_to_idx_dict
         self._number_of_features = sum(
-            [
-                len(feature_values.values())
-                for feature_values in self._feature_to_idx_dict.values()
-            ]
+            len(feature_values) for feature_values in self._feature_to_idx_dict.values()
         )
         if check_consistency_with_config:
-            known_features = set(self._feature_to_idx_dict.keys())
-            not_in_config = known_features.difference(
-                (
-                    (window_idx, feature_name)
-                    for window_idx, feature_names in enumerate(self._feature_config)
-                    for feature_name in feature_names
-                )
-            )
+            configured_features = {
+                (window_idx, feature_name)
+                for window_idx, feature_names in enumerate(self._feature_config)
+                for feature_name in feature_names
+            }
+            not_in_config = self._feature_to_idx_dict.keys() - configured_features
             if not_in_config:
                 rasa.shared.utils.io.raise_warning(
                     f"A feature to index mapping has been loaded that does not match "
@@ -201,6 +212,47 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
                     f" {self._feature_config}. "
                     f"Continuing with constant values for these features. "
                 )
+        self._window_features = self._compile_window_features(self._feature_config)
+        # for each window feature, the index of every possible value of the feature
+        # (by value code, see `_feature_codes`), or -1 for values unseen in training
+        self._window_feature_tables: List[Tuple[int, Text, np.ndarray]] = []
+        for relative_position, position_and_feature_name, feature_name in self._window_features:
+            value_codes = self._FEATURE_VALUE_CODES[feature_name]
+            table = np.full(len(value_codes), -1, dtype=np.int32)
+            for feature_value, feature_idx in self._feature_to_idx_dict.get(
+                    position_and_feature_name, {}
+            ).items():
+                if feature_value in value_codes:
+                    table[value_codes[feature_value]] = feature_idx
+            self._window_feature_tables.append((relative_position, feature_name, table))
+
+    @staticmethod
+    def _compile_window_features(
+            feature_config: List[List[Text]]
+    ) -> List[Tuple[int, Tuple[int, Text], Text]]:
+        """Flattens the configured features of all window positions.
+
+        Args:
+          feature_config: the names of the features extracted at each window position
+        Returns:
+          a list of tuples containing
+          - the position relative to the current token,
+          - the position (in the window) and the feature name and
+          - the feature name
+        """
+        # in case of an even number we will look at one more word before,
+        # e.g. window size 4 will result in a window range of
+        # [-2, -1, 0, 1] (0 = current word in sentence)
+        window_size = len(feature_config)
+        half_window_size = window_size // 2
+        window_range = range(-half_window_size, half_window_size + window_size % 2)
+        assert len(window_range) == window_size
+
+        return [
+            (relative_position, (window_position, feature_name), feature_name)
+            for window_position, relative_position in enumerate(window_range)
+            for feature_name in feature_config[window_position]
+        ]
 
     def train(self, training_data: TrainingData) -> Resource:
         """Trains the featurizer.
@@ -222,19 +274,29 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         self.persist()
         return self._resource
 
-    def _deps_for_text(self, text: str):
-        doc = self.nlp_spacy(text.lower())
-        pre_deps = precomputed_deps[text] if text in precomputed_deps else None
-        if not pre_deps:
-            raise Exception(f"No manually annotated syntactic features were defined for sentence <{text}>")
+    @staticmethod
+    def _deps_for_text(text: Text, num_tokens: int) -> np.ndarray:
+        """Looks up the syntactic dependency of each token of a text.
 
-        word_syntactic_deps = []
-        for i, spacy_token in enumerate(doc):
-            no_spec_chars = spacy_token.text.translate(str.maketrans('', '', string.punctuation))
-            # word_syntactic_deps.append(spacy_token.dep_ if no_spec_chars and spacy_token.dep_ in deps else '-')
-            word_syntactic_deps.append(pre_deps[i] if pre_deps else '-')
+        The dependencies come from the manual annotations, which are written against
+        the same tokenization as the tokens of the message, so the text does not
+        have to be tokenized again.
 
-        return word_syntactic_deps
+        Args:
+          text: the text of a message
+          num_tokens: the number of tokens of the message
+        Returns:
+          the code of the syntactic dependency of every token
+        """
+        pre_deps = find_precomputed_deps(text, num_tokens)
+        if pre_deps is None:
+            if not has_precomputed_deps(text):
+                raise Exception(f"No manually annotated syntactic features were defined for sentence <{text}>")
+            raise Exception(
+                f"The manually annotated syntactic features of sentence <{text}> "
+                f"do not cover all of its {num_tokens} tokens"
+            )
+        return encode_deps(pre_deps)[:num_tokens]
 
     def _create_feature_to_idx_dict(
             self, training_data: TrainingData
@@ -248,65 +310,60 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
            (where `unique` means unique with respect to all indices in the
            *nested* mapping)
         """
-        # collect all raw feature values
-        feature_vocabulary: Dict[Tuple[int, Text], Set[Text]] = dict()
+        # collect all raw feature values (as a mask over the value codes)
+        seen_feature_values: Dict[Tuple[int, Text], np.ndarray] = dict()
         for example in training_data.training_examples:
-            tokens = example.get(TOKENS_NAMES[TEXT], [])
-
             text = example.get(TEXT)
-            if text:
-                sentence_features = self._map_tokens_to_raw_features(tokens, text)
-
-                for token_features in sentence_features:
-                    for position_and_feature_name, feature_value in token_features.items():
-                        feature_vocabulary.setdefault(position_and_feature_name, set()).add(feature_value)
-
+            num_tokens = len(example.get(TOKENS_NAMES[TEXT], []))
+            if not text or not num_tokens:
+                continue
+            syntactic_deps = self._deps_for_text(text, num_tokens)
+            feature_codes = self._feature_codes(syntactic_deps, num_tokens)
+
+            # every token inside the sentence is seen at each window position by
+            # some anchor, so the values are collected per feature instead of
+            # building the feature dictionary of every token
+            for relative_position, position_and_feature_name, feature_name in self._window_features:
+                start = max(0, relative_position)
+                stop = min(num_tokens, num_tokens + relative_position)
+                if start >= stop:
+                    continue
+                if position_and_feature_name not in seen_feature_values:
+                    seen_feature_values[position_and_feature_name] = np.zeros(
+                        len(self._FEATURE_VALUES[feature_name]), dtype=bool
+                    )
+                seen_feature_values[position_and_feature_name][
+                    feature_codes[feature_name][start:stop]
+                ] = True
+
+        # the values are only needed as text for the persisted mapping
+        feature_vocabulary: Dict[Tuple[int, Text], Set[Text]] = {
+            position_and_feature_name: {
+                self._FEATURE_VALUES[position_and_feature_name[1]][code]
+                for code in np.flatnonzero(seen)
+            }
+            for position_and_feature_name, seen in seen_feature_values.items()
+        }
         # assign a unique index to each feature value
         return self._build_feature_to_index_map(feature_vocabulary)
 
-    def _map_tokens_to_raw_features(self, tokens: List[Token], text: str) -> List[Dict[Tuple[int, Text], Text]]:
-        """Extracts the raw feature values.
+    @staticmethod
+    def _feature_codes(syntactic_deps: np.ndarray, num_tokens: int) -> Dict[Text, np.ndarray]:
+        """Computes the codes of the values of every supported feature for all tokens.
 
         Args:
-          tokens: a tokenized text
+          syntactic_deps: the code of the syntactic dependency of each token in the text
+          num_tokens: the total number of tokens in the text
         Returns:
-          a list of feature dictionaries for each token in the given list
-          where each feature dictionary maps a tuple containing
-          - a position (in the window) and
-          - a supported feature name
-          to the corresponding raw feature value
+          a mapping from the supported feature names to the value code of each token
+          (see `_FEATURE_VALUE_CODES`)
         """
-        sentence_features = []
-
-        syntactic_deps = self._deps_for_text(text)
-        # print(list(map(lambda t: t.text, tokens)), f"\"{text}\"", syntactic_deps)
-
-        # in case of an even number we will look at one more word before,
-        # e.g. window size 4 will result in a window range of
-        # [-2, -1, 0, 1] (0 = current word in sentence)
-        window_size = len(self._feature_config)
-        half_window_size = window_size // 2
-        window_range = range(-half_window_size, half_window_size + window_size % 2)
-        assert len(window_range) == window_size
-
-        for anchor in range(len(tokens)):
-
-            token_features: Dict[Tuple[int, Text], Text] = {}
-
-            for window_position, relative_position in enumerate(window_range):
-                absolute_position = anchor + relative_position
-
-                # skip, if current_idx is pointing to a non-existing token
-                if absolute_position < 0 or absolute_position >= len(tokens):
-                    continue
-
-                token = tokens[absolute_position]
-                for feature_name in self._feature_config[window_position]:
-                    token_features[(window_position, feature_name)] = syntactic_deps[absolute_position]
-
-            sentence_features.append(token_features)
-
-        return sentence_features
+        token_positions = np.arange(num_tokens)
+        return {
+            "syntactic_dep": syntactic_deps,
+            BEGIN_OF_SENTENCE: (token_positions == 0).astype(np.intp),
+            END_OF_SENTENCE: (token_positions == num_tokens - 1).astype(np.intp),
+        }
 
     @staticmethod
     def _build_feature_to_index_map(
@@ -356,8 +413,16 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         Returns:
           The same list with the same messages after featurization.
         """
+        if not self._feature_to_idx_dict:
+            rasa.shared.utils.io.raise_warning(
+                f"The {self.__class__.__name__} {self._identifier} has not been "
+                f"trained properly yet. "
+                f"Continuing without adding features from this featurizer."
+            )
+            return messages
         for message in messages:
-            self._process_message(message)
+            if message.get(TEXT) and message.get(TOKENS_NAMES[TEXT]):
+                self._process_message(message)
         return messages
 
     def process_training_data(self, training_data: TrainingData) -> TrainingData:
@@ -378,62 +443,59 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         Args:
           message: a message to be featurized
         """
-        if not self._feature_to_idx_dict:
-            rasa.shared.utils.io.raise_warning(
-                f"The {self.__class__.__name__} {self._identifier} has not been "
-                f"trained properly yet. "
-                f"Continuing without adding features from this featurizer."
-            )
-            return
         tokens = message.get(TOKENS_NAMES[TEXT])
-        text = message.get(TEXT)
-        if text and tokens:
-            sentence_features = self._map_tokens_to_raw_features(tokens, text)
-            sparse_matrix = self._map_raw_features_to_indices(sentence_features)
-
-            self.add_features_to_message(
-                # FIXME: create sentence feature and make `sentence` non optional
-                sequence=sparse_matrix,
-                sentence=None,
-                attribute=TEXT,
-                message=message,
-            )
+        syntactic_deps = self._deps_for_text(message.get(TEXT), len(tokens))
+        sparse_matrix = self._map_tokens_to_indices(len(tokens), syntactic_deps)
+
+        self.add_features_to_message(
+            # FIXME: create sentence feature and make `sentence` non optional
+            sequence=sparse_matrix,
+            sentence=None,
+            attribute=TEXT,
+            message=message,
+        )
 
-    def _map_raw_features_to_indices(
-            self, sentence_features: List[Dict[Tuple[int, Text], Any]]
-    ) -> scipy.sparse.coo_matrix:
-        """Converts the raw features to one-hot encodings.
+    def _map_tokens_to_indices(
+            self, num_tokens: int, syntactic_deps: np.ndarray
+    ) -> scipy.sparse.csr_matrix:
+        """Encodes the features extracted from the window around each token.
 
         Requires the "feature" to index dictionary, i.e. the featurizer must have
         been trained.
 
         Args:
-          sentence_features: a list of feature dictionaries where the `t`-th feature
-            dictionary maps a tuple containing
-            - a position (in the window) and
-            - a supported feature name
-            to the raw feature value extracted from the window around the `t`-th token.
-
+          num_tokens: the number of tokens of the text
+          syntactic_deps: the code of the syntactic dependency of each token in the text
         Returns:
            a sparse matrix where the `i`-th row is a multi-hot vector that encodes the
            raw features extracted from the window around the `i`-th token
         """
-        rows = []
-        cols = []
-        shape = (len(sentence_features), self._number_of_features)
-        for token_idx, token_features in enumerate(sentence_features):
-            for position_and_feature_name, feature_value in token_features.items():
-                mapping = self._feature_to_idx_dict.get(position_and_feature_name)
-                if not mapping:
-                    continue
-                feature_idx = mapping.get(feature_value, -1)
-                if feature_idx > -1:
-                    rows.append(token_idx)
-                    cols.append(feature_idx)
-        rows = np.array(rows)
-        cols = np.array(cols)
-        data = np.ones(len(rows))
-        return scipy.sparse.coo_matrix((data, (rows, cols)), shape=shape)
+        feature_codes = self._feature_codes(syntactic_deps, num_tokens)
+        # the index of the value of each window feature for every token (anchor),
+        # or -1 if the window position is outside of the text or the value is unknown;
+        # a window feature reads the column of its feature shifted by its relative
+        # position, so it is filled with one slice instead of a loop over the anchors
+        feature_indices = np.full((num_tokens, len(self._window_feature_tables)), -1, dtype=np.int32)
+        for window_feature_idx, (relative_position, feature_name, table) in enumerate(
+                self._window_feature_tables
+        ):
+            start = max(0, -relative_position)
+            stop = min(num_tokens, num_tokens - relative_position)
+            if start < stop:
+                feature_indices[start:stop, window_feature_idx] = table[
+                    feature_codes[feature_name][start + relative_position:stop + relative_position]
+                ]
+
+        found = feature_indices >= 0
+        indptr = np.zeros(num_tokens + 1, dtype=np.int32)
+        np.cumsum(found.sum(axis=1), out=indptr[1:])
+        # boolean indexing is row-major, so the entries are laid out row by row
+        indices = feature_indices[found]
+        data = np.ones(len(indices), dtype=np.int8)
+
+        return scipy.sparse.csr_matrix(
+            (data, indices, indptr), shape=(num_tokens, self._number_of_features)
+        )
 
     @classmethod
     def create(
@@ -458,10 +520,15 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
         """Loads trained component (see parent class for full docstring)."""
         try:
             with model_storage.read_from(resource) as model_path:
-                feature_to_idx_dict = rasa.utils.io.json_unpickle(
-                    model_path / cls.FILENAME_FEATURE_TO_IDX_DICT,
-                    encode_non_string_keys=True,
-                )
+                arrays_path = model_path / cls.FILENAME_FEATURE_TO_IDX_ARRAYS
+                if arrays_path.exists():
+                    feature_to_idx_dict = cls._load_feature_to_idx_dict(arrays_path)
+                else:
+                    # models trained before the mapping was stored as numpy arrays
+                    feature_to_idx_dict = rasa.utils.io.json_unpickle(
+                        model_path / cls.FILENAME_FEATURE_TO_IDX_DICT,
+                        encode_non_string_keys=True,
+                    )
                 return cls(
                     config=config,
                     model_storage=model_storage,
@@ -487,8 +554,63 @@ class SyntacticFeaturizer(SparseFeaturizer, GraphComponent):
             return None
 
         with self._model_storage.write_to(self._resource) as model_path:
-            rasa.utils.io.json_pickle(
-                model_path / self.FILENAME_FEATURE_TO_IDX_DICT,
+            self._save_feature_to_idx_dict(
+                model_path / self.FILENAME_FEATURE_TO_IDX_ARRAYS,
                 self._feature_to_idx_dict,
-                encode_non_string_keys=True,
             )
+
+    @staticmethod
+    def _save_feature_to_idx_dict(
+            path: Path, feature_to_idx_dict: Dict[Tuple[int, Text], Dict[Text, int]]
+    ) -> None:
+        """Saves the "feature" to index mapping as flat numpy arrays.
+
+        Feature names and values are stored once, in string tables, and referenced
+        by their ids.
+
+        Args:
+          path: the path of the `.npz` file
+          feature_to_idx_dict: the mapping to be saved
+        """
+        window_positions, feature_names, feature_values, feature_indices = [], [], [], []
+        for (window_position, feature_name), values_to_idx in feature_to_idx_dict.items():
+            for feature_value, feature_idx in values_to_idx.items():
+                window_positions.append(window_position)
+                feature_names.append(feature_name)
+                feature_values.append(feature_value)
+                feature_indices.append(feature_idx)
+
+        names, name_ids = np.unique(np.array(feature_names, dtype=str), return_inverse=True)
+        values, value_ids = np.unique(np.array(feature_values, dtype=str), return_inverse=True)
+        np.savez_compressed(
+            path,
+            window_positions=np.array(window_positions, dtype=np.int32),
+            name_ids=name_ids.astype(np.int32),
+            value_ids=value_ids.astype(np.int32),
+            feature_indices=np.array(feature_indices, dtype=np.int32),
+            names=names,
+            values=values,
+        )
+
+    @staticmethod
+    def _load_feature_to_idx_dict(path: Path) -> Dict[Tuple[int, Text], Dict[Text, int]]:
+        """Loads a "feature" to index mapping saved by `_save_feature_to_idx_dict`.
+
+        Args:
+          path: the path of the `.npz` file
+        Returns:
+          the nested "feature" to index mapping
+        """
+        feature_to_idx_dict: Dict[Tuple[int, Text], Dict[Text, int]] = {}
+        with np.load(path) as arrays:
+            rows = zip(
+                arrays["window_positions"].tolist(),
+                arrays["names"][arrays["name_ids"]].tolist(),
+                arrays["values"][arrays["value_ids"]].tolist(),
+                arrays["feature_indices"].tolist(),
+            )
+            for window_position, feature_name, feature_value, feature_idx in rows:
+                feature_to_idx_dict.setdefault(
+                    (window_position, feature_name), {}
+                )[feature_value] = feature_idx
+        return feature_to_idx_dict
@@ -18,6 +18,13 @@ from spacy.lang.ro.tag_map import TAG_MAP
 
 SEMANTIC_ROLES = "semantic_roles"
 
+# Dependencies of the words that are part of the span of their head
+SPAN_DEPS = frozenset({'-', 'cât'})
+# ... including the attributes of the head, when the whole extended span is required
+EXTENDED_SPAN_DEPS = SPAN_DEPS | {'care', 'ce fel de', 'al cui'}
+# Dependencies of the attributes that identify a specific instance of an entity
+SPECIFIER_DEPS = frozenset({'care', 'ce fel de', 'cât'})
+
 
 @DefaultV1Recipe.register(
     DefaultV1Recipe.ComponentType.MESSAGE_FEATURIZER, is_trainable=False
@@ -50,6 +57,9 @@ class SyntacticParser(GraphComponent):
 
         # Initialize the lemmatizer
         self.lemmas = self.__load_lemmas()
+        # Proper nouns and pronouns are looked up regardless of the part of speech
+        self.override_lemmas = (self.lemmas[symbols.PROPN], self.lemmas[symbols.PRON])
+        self.lemmas_by_pos = {pos: self.lemmas[pos] for pos in (symbols.NOUN, symbols.VERB)}
 
     @classmethod
     def create(
@@ -125,36 +135,31 @@ class SyntacticParser(GraphComponent):
             return TAG_MAP[tag][symbols.POS]
         return stub_tag_map.get(tag[0])
 
-    def __lemmatize(self, token):
+    @staticmethod
+    def __compact_tag(token):
+        """ Extract the compact tag (without the morphological features) of a token. """
+
+        return token.tag_.partition('__')[0]
+
+    def __lemmatize(self, token, tag):
         """
-        Get the lemma for the given inflected word.
+        Get the lemma for the given inflected word, with the given compact tag.
 
         :return the word's lemma ot the same word if the lemma is not available in the lookup tables
         """
 
-        tag = token.tag_.split('__')[0]  # Extract the compact tag
         pos = self.__part_of_speech_from_tag(tag)
         word = token.text
 
-        # POS = proper noun
-        if word in self.lemmas[symbols.PROPN]:
-            return self.lemmas[symbols.PROPN][word]
-
-        # POS = pronoun
-        if word in self.lemmas[symbols.PRON]:
-            return self.lemmas[symbols.PRON][word]
-
-        # POS = noun
-        if pos == symbols.NOUN:
-            return self.lemmas[symbols.NOUN].get(word, word)
-
-        # POS = verb
-        if pos == symbols.VERB:
-            return self.lemmas[symbols.VERB].get(word, word)
+        # POS = proper noun / pronoun
+        for lemmas in self.override_lemmas:
+            if word in lemmas:
+                return lemmas[word]
 
+        # POS = noun / verb
         # TODO numeral - doi/două -> 2
-
-        return word
+        lemmas = self.lemmas_by_pos.get(pos)
+        return lemmas.get(word, word) if lemmas is not None else word
 
     def __get_dependency_span(self, doc, token, include_all_deps=False):
         """
@@ -162,29 +167,34 @@ class SyntacticParser(GraphComponent):
         (representing attributes/prepositions/articles etc).
         """
 
-        def dfs(node):
+        span_deps = EXTENDED_SPAN_DEPS if include_all_deps else SPAN_DEPS
+
+        def bounds(node):
             """
-            Depth First Search through the dependency tree
+            Traverse the dependency tree (depth first, with an explicit stack)
             to determine the span that includes a certain token.
+            Prepositional children are left out of the span.
             """
 
             first = last = node.i
-            prep_first = prep_last = None
-            for child in node.children:
-                if child.dep_ in ['-', 'prep', 'cât'] or \
-                        (include_all_deps and child.dep_ in ['care', 'ce fel de', 'al cui']):
-                    child_first, child_last, _, _ = dfs(child)
-
-                    if child.dep_ == 'prep':
-                        prep_first = child_first
-                        prep_last = child_last
-                    else:
-                        first = min(first, child_first)
-                        last = max(last, child_last)
-
-            return first, last, prep_first, prep_last
-
-        first, last, prep_first, prep_last = dfs(token)  # compute bounds of the span
+            stack = [node]
+            while stack:
+                for child in stack.pop().children:
+                    if child.dep_ in span_deps:
+                        first = min(first, child.i)
+                        last = max(last, child.i)
+                        stack.append(child)
+
+            return first, last
+
+        first, last = bounds(token)  # compute bounds of the span
+
+        # the preposition is the span of the (last) prepositional child of the token
+        prep_first = prep_last = None
+        for child in token.children:
+            if child.dep_ == 'prep':
+                prep_first, prep_last = bounds(child)
+
         span = Span(doc, first, last + 1)
 
         prep_span = Span(doc, prep_first, prep_last + 1) if prep_first is not None else None
@@ -198,7 +208,7 @@ class SyntacticParser(GraphComponent):
         specifiers = []
         for token in doc:
             if token.head == parent:
-                if token.dep_ in ['care', 'ce fel de', 'cât'] or \
+                if token.dep_ in SPECIFIER_DEPS or \
                         token.dep_ == 'cât timp' and token.head.dep_ != "ROOT":
                     ext_value, prep = self.__get_dependency_span(doc, token, True)
                     specifiers.append({
@@ -206,15 +216,15 @@ class SyntacticParser(GraphComponent):
                         "determiner": self.__get_dependency_span(doc, token.head)[0],
                         "pre": prep,
                         "value": ext_value,
-                        "lemma": self.__get_dependency_span(doc, token, True)[0],
+                        "lemma": ext_value,
                         "specifiers": []
                     })
-                elif token.dep_ in ['al cui']:
+                elif token.dep_ == 'al cui':
                     specifiers.append({
                         "question": token.dep_,
                         "determiner": self.__get_dependency_span(doc, token.head)[0],
                         "value": token.text,
-                        "lemma": self.__lemmatize(token),
+                        "lemma": self.__lemmatize(token, self.__compact_tag(token)),
                         "specifiers": self.__get_specifiers(doc, token)
                     })
 
@@ -228,36 +238,39 @@ class SyntacticParser(GraphComponent):
         of ANY component and on any context attributes created by a call to :meth:`components.Component.process`
         of components previous to this one."""
 
-        for message in messages:
-            # Parse the phrase
-            text = message.get(TEXT)
-            if not text:
-                continue
-            doc = self.nlp_spacy(text.lower())
-
+        # Parse the phrases (in batches, which is considerably faster than one by one)
+        messages_to_parse = [message for message in messages if message.get(TEXT)]
+        docs = self.nlp_spacy.pipe((message.get(TEXT).lower() for message in messages_to_parse), batch_size=64)
+        for message, doc in zip(messages_to_parse, docs):
             semantic_roles = []
             inferred_subj = None
 
+            # Read the dependency label and the head of every token only once
+            dep_labels = [token.dep_ for token in doc]
+            head_dep_labels = [dep_labels[token.head.i] for token in doc]
+
             for token in doc:
+                dep_label = dep_labels[token.i]
+                tag = self.__compact_tag(token)
+                tag_features = TAG_MAP.get(tag, {})
                 # Identify principal components of the sentence
-                if token.dep_ not in ['-'] and token.head.dep_ == 'ROOT':
+                if dep_label != '-' and head_dep_labels[token.i] == 'ROOT':
                     ext_value, prep = self.__get_dependency_span(doc, token, True)
                     semantic_roles.append({
-                        "question": token.dep_,
+                        "question": dep_label,
                         "determiner": self.__get_dependency_span(doc, token.head)[0],
                         "pre": prep,
                         "value": token.text,
-                        "lemma": self.__lemmatize(token),
+                        "lemma": self.__lemmatize(token, tag),
                         "ext_value": ext_value,
                         "specifiers": self.__get_specifiers(doc, token)
                     })
 
                 # Infer the subject (me) if the action is at the 1st person, singular
-                if token.dep_ == 'ROOT' and (
-                        (TAG_MAP[token.tag_.split('__')[0]].get('Person', '') == '1' and
-                         TAG_MAP[token.tag_.split('__')[0]].get('Number', '') == 'Sing')
+                if dep_label == 'ROOT' and (
+                        (tag_features.get('Person', '') == '1' and tag_features.get('Number', '') == 'Sing')
                         or
-                        any(t.text == 'am' and t.dep_ == '-' and t.head.dep_ == 'ROOT' for t in doc)
+                        any(t.text == 'am' and dep_labels[t.i] == '-' and head_dep_labels[t.i] == 'ROOT' for t in doc)
                 ):
                     inferred_subj = {
                         "question": "cine",
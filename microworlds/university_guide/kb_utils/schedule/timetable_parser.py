@@ -6,9 +6,32 @@ import codecs
 from rdflib import Graph, Literal, URIRef, BNode, Namespace
 from rdflib.namespace import RDF, RDFS, XSD
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # constants
 DAYS = ['Luni', 'Marți', 'Miercuri', 'Joi', 'Vineri']
+ACTIVITY_TYPES = {
+    'C': 'course',
+    'S': 'seminar',
+    'L': 'lab',
+    'P': 'p',
+}
+# activity type markers written in brackets, e.g. (S), (CURS)
+ACTIVITY_TYPE_MARKERS = frozenset({'S', 'L', 'P', 'C', 'CURS'})
+
+# regular expressions used for parsing the cells (compiled once)
+SPACE_REGEX = re.compile(r'\s')
+SPACES_REGEX = re.compile(r'\s+')
+OPTIONAL_GROUP_REGEX = re.compile('OP')
+NUMBER_REGEX = re.compile(r'[0-9]+')
+HOUR_REGEX = re.compile(r'\s*([0-9]+)')  # start hour of an hour range (e.g. 8-10)
+ACTIVITY_TYPE_REGEX = re.compile(r'\((S|L|P|C|CURS)\)')
+TEACHER_REGEX = re.compile(r'(?:PROF\.?|CONF\.?|[SȘ]\.?L\.?) ?([\w.-]+ [\w.-]+)')
+ROOM_REGEX = re.compile(r'\w+ ?[0-9]{2,}\w*(?: LEU)?')  # TODO PR100/101
+TITLE_REGEX = re.compile(r'(?:\(.*\) )?([\w ]+)')
+ACTIVITY_ID_REGEX = re.compile(r'[\w ]+')
+BRACKETED_WORD_REGEX = re.compile(r'\((\w+)\)')
+BRACKETED_TEXT_REGEX = re.compile(r'\(.+\)')
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
@@ -21,12 +44,55 @@ class SheetParser:
 
         # borders of the cells will be memoized in a dict for efficiency
         self.cell_border_cache = {}
+        self.right_bottom_border_cache = {}
 
-    @staticmethod
-    def xlc(cell):
-        """ Build the Excel name representation of a cell. """
+        # merged range containing each merged cell, so that it is not searched for every cell
+        self.merged_range_of_cell = {}
+        for merged_range in self.sheet.merged_cells.ranges:
+            for row in range(merged_range.min_row, merged_range.max_row + 1):
+                for col in range(merged_range.min_col, merged_range.max_col + 1):
+                    self.merged_range_of_cell.setdefault((row, col), merged_range)
+
+    def cell_at(self, cell):
+        """ Get the sheet cell at the given (row, column) position (without building its Excel name). """
+
+        return self.sheet.cell(row=cell[0], column=cell[1])
+
+    def right_bottom_borders(self, cell):
+        """
+        Find the right and bottom (manually marked) borders of the given cell.
+        Unlike the left and top ones, these do not depend on the borders of other cells, so they are computed directly.
+        """
+
+        if cell in self.right_bottom_border_cache:
+            return self.right_bottom_border_cache[cell]
+
+        row, col = cell
+        own_cell = self.cell_at(cell)
+        own_border = own_cell.border
+
+        is_top_left_merged = False
+        right = bottom = None
+        merged_range = self.merged_range_of_cell.get(cell)
+        if merged_range:
+            # The cell is contained in a merged range
+            is_top_left_merged = own_cell == merged_range.start_cell
+
+            if row == merged_range.max_row:
+                bottom = merged_range.start_cell.border.bottom.style
+            if col == merged_range.max_col:
+                right = merged_range.start_cell.border.right.style
+
+        bottom = bottom or self.cell_at((row + 1, col)).border.top.style
+        if not bottom and not is_top_left_merged:
+            bottom = own_border.bottom.style
+
+        right = right or self.cell_at((row, col + 1)).border.left.style
+        if not right and not is_top_left_merged:
+            right = own_border.right.style
 
-        return chr(cell[1] + 64) + str(cell[0])
+        self.right_bottom_border_cache[cell] = right, bottom
+        return right, bottom
 
     def cell_borders(self, cell):
         """
@@ -39,35 +105,15 @@ class SheetParser:
             return self.cell_border_cache[cell]
 
         row, col = cell
-        own_border = self.sheet[self.xlc(cell)].border
+        own_border = self.cell_at(cell).border
+        # The left and top borders are shared with the right and bottom borders of the neighbouring cells
         left = own_border.left.style \
-               or col > 1 and self.cell_borders((row, col - 1))['right'] \
+               or col > 1 and self.right_bottom_borders((row, col - 1))[0] \
                or None
         top = own_border.top.style \
-              or row > 1 and self.cell_borders((row - 1, col))['bottom'] \
+              or row > 1 and self.right_bottom_borders((row - 1, col))[1] \
               or None
-
-        is_top_left_merged = False
-        right = bottom = None
-        for merged_range in self.sheet.merged_cells.ranges:
-            if merged_range.min_row <= row <= merged_range.max_row \
-                    and merged_range.min_col <= col <= merged_range.max_col:
-                # The cell is contained in the current merged range
-                is_top_left_merged = self.sheet[self.xlc(cell)] == merged_range.start_cell
-
-                if row == merged_range.max_row:
-                    bottom = merged_range.start_cell.border.bottom.style
-                if col == merged_range.max_col:
-                    right = merged_range.start_cell.border.right.style
-                break
-
-        bottom = bottom or self.sheet[self.xlc((row + 1, col))].border.top.style
-        if not bottom and not is_top_left_merged:
-            bottom = own_border.bottom.style
-
-        right = right or self.sheet[self.xlc((row, col + 1))].border.left.style
-        if not right and not is_top_left_merged:
-            right = own_border.right.style
+        right, bottom = self.right_bottom_borders(cell)
 
         borders = {'left': left, 'top': top, 'right': right, 'bottom': bottom}
         self.cell_border_cache[cell] = borders
@@ -77,16 +123,16 @@ class SheetParser:
         """ Identify the minimal rectangle that contains the given cell and is bounded by a border. """
 
         row, col = cell
-        while not self.cell_borders((cell[0], col))['right']:
+        while not self.right_bottom_borders((cell[0], col))[0]:
             col += 1
-        while not self.cell_borders((row, cell[1]))['bottom']:
+        while not self.right_bottom_borders((row, cell[1]))[1]:
             row += 1
         return cell[0], cell[1], row, col
 
     def identify_row_hours(self, cell):
         """
         Identify the day and the hour corresponding to each row.
-        :return dictionary of pairs row: (day, start hour)
+        :return dictionary of pairs row: (day, start hour), None if the first hour range is missing
         """
 
         row_hours = {}
@@ -96,8 +142,13 @@ class SheetParser:
         while day:
             if not current_hour:
                 # This is the first hour of the current day
+                hour_range = self.cell_at(cell).value
+                if hour_range is None:
+                    # The table ends before the last day
+                    logger.warning(f'Missing hour range cell for {day}, the schedule of the next days is ignored')
+                    break
                 try:
-                    current_hour = int(self.sheet[self.xlc(cell)].value.strip().split('-')[0])
+                    current_hour = int(HOUR_REGEX.match(hour_range).group(1))
                 except:
                     logger.error('Parsing of hour range cell failed')
                     raise
@@ -114,6 +165,10 @@ class SheetParser:
 
             cell = (cell[0] + 1, cell[1])
 
+        if not row_hours:
+            logger.error(f'Missing hour range cell {self.cell_at(cell).coordinate} in sheet {self.sheet.title}')
+            return None
+
         logger.debug(' - Row hours: ' + str(row_hours))
         return row_hours
 
@@ -122,14 +177,14 @@ class SheetParser:
 
         cell = (table_corner[0], table_corner[1] + 2)
         groups = []
-        while self.sheet[self.xlc(cell)].value:
+        while self.cell_at(cell).value:
             # Extract the group name and standardize it
-            group_name = self.sheet[self.xlc(cell)].value.strip().upper()
-            if re.search('OP', group_name):
+            group_name = self.cell_at(cell).value.strip().upper()
+            if OPTIONAL_GROUP_REGEX.search(group_name):
                 # optional group
-                optional_nums = re.findall(r'[0-9]+', group_name)
+                optional_nums = NUMBER_REGEX.findall(group_name)
                 group_name = 'OPT' + self.series
-            group_name = re.sub(r'\s', '', group_name)  # Remove spaces
+            group_name = SPACE_REGEX.sub('', group_name)  # Remove spaces
 
             first_col = cell[1]
             # Find the range of columns of the current group
@@ -146,39 +201,32 @@ class SheetParser:
 
     @staticmethod
     def parse_activity_description(act_description):
-        act_type_map = {
-            'C': 'course',
-            'S': 'seminar',
-            'L': 'lab',
-            'P': 'p',
-        }
-
         # Clean the full description
-        act_description = re.sub(r'\s+', ' ', act_description.strip()).upper()
+        act_description = SPACES_REGEX.sub(' ', act_description.strip()).upper()
 
-        act_type = re.search(r'\((S|L|P|C|CURS)\)', act_description)
+        act_type = ACTIVITY_TYPE_REGEX.search(act_description)
         act_type = act_type.group(1)[0] if act_type else 'C'
 
-        teacher = re.findall(r'(?:PROF\.?|CONF\.?|[SȘ]\.?L\.?) ?([\w.-]+ [\w.-]+)', act_description)
-        rooms = re.findall(r'\w+ ?[0-9]{2,}\w*(?: LEU)?', act_description)  # TODO PR100/101
+        teacher = TEACHER_REGEX.findall(act_description)
+        rooms = ROOM_REGEX.findall(act_description)
 
         # TODO cursuri care nu au titlu, ci doar ID
         title = act_id = None
         if teacher:
             # This is a course
-            title = re.match(r'(?:\(.*\) )?([\w ]+)', act_description)
+            title = TITLE_REGEX.match(act_description)
             title = title.group(1) if title else None
         else:
-            act_id = re.match(r'[\w ]+', act_description)
+            act_id = ACTIVITY_ID_REGEX.match(act_description)
             act_id = act_id.group(0) if act_id else None
 
-        act_id = act_id or next(filter(lambda s: s not in ['S', 'L', 'P', 'C', 'CURS'],
-                                       re.findall(r'\((\w+)\)', act_description)), None)
+        act_id = act_id or next(filter(lambda s: s not in ACTIVITY_TYPE_MARKERS,
+                                       BRACKETED_WORD_REGEX.findall(act_description)), None)
 
         activity = {
             'id': act_id.strip() if act_id else None,
             'title': title.strip() if title else None,
-            'type': act_type_map.get(act_type, 'unknown'),
+            'type': ACTIVITY_TYPES.get(act_type, 'unknown'),
             'teacher': teacher,
             'room': [room.replace(' ', '') for room in rooms]
         }
@@ -193,18 +241,21 @@ class SheetParser:
         def add_to_schedule(description, time, groups):
             schedule.append({
                 **self.parse_activity_description(description),
-                'time': (*time, 1) if cell_obj.alignment.horizontal in ['left', None] else time,
+                'time': (*time, 1) if left_aligned else time,
                 'groups': groups,
                 'series': self.series
             })
 
-        for cell in [(r, c) for r in range(row_min, row_max + 1) for c in range(col_min, col_max + 1)]:
-            cell_obj = self.sheet[self.xlc(cell)]
+        # Walk the cells of the subtable row by row, as returned (in bulk) by the sheet
+        subtable_rows = self.sheet.iter_rows(min_row=row_min, max_row=row_max, min_col=col_min, max_col=col_max)
+        for cell_obj in (cell_obj for row_cells in subtable_rows for cell_obj in row_cells):
+            cell = cell_obj.row, cell_obj.column
             borders = self.cell_borders(cell)
             # Search for activities inspecting bordered boxes by their top-left cell
             if borders['left'] and borders['top'] and \
                     (not cell_obj.fill.patternType or cell_obj.fill.fgColor.tint == 0):
                 activity_description = cell_obj.value or ''
+                left_aligned = cell_obj.alignment.horizontal in ('left', None)
 
                 box_top, box_left, box_bottom, box_right = self.border_box(cell)
 
@@ -230,20 +281,22 @@ class SheetParser:
                 even_week_act = ''
                 for r in range(box_top + 1, box_bottom + 1):
                     for c in range(box_left, box_right + 1):
-                        if self.sheet[self.xlc((r, c))].value:
-                            if (cell_obj.alignment.horizontal in ['left', None] or not activity_description) \
-                                    and (c > box_left or self.sheet[self.xlc((r, c))].alignment.horizontal == 'right'):
+                        box_cell = self.cell_at((r, c))
+                        box_value = box_cell.value
+                        if box_value:
+                            if (left_aligned or not activity_description) \
+                                    and (c > box_left or box_cell.alignment.horizontal == 'right'):
                                 # The value is on the bottom-right side of the box => even parity
-                                even_week_act += self.sheet[self.xlc((r, c))].value + ' '
+                                even_week_act += box_value + ' '
                             else:
                                 # The value is just an additional information of the current activity
-                                activity_description += ' ' + self.sheet[self.xlc((r, c))].value
+                                activity_description += ' ' + box_value
 
                 if even_week_act:
                     # Check if there are really 2 activities,
                     # or the second description represents the room of the activity
-                    if re.search(r'\(.+\)', activity_description):  # activity title contains its type in brackets ()
-                        if re.search(r'\(.+\)', even_week_act):
+                    if BRACKETED_TEXT_REGEX.search(activity_description):  # activity title contains its type in brackets ()
+                        if BRACKETED_TEXT_REGEX.search(even_week_act):
                             # Both values represent course descriptions
                             act_odd, act_even = activity_description, even_week_act
                         else:
@@ -260,7 +313,7 @@ class SheetParser:
                 elif activity_description:
                     # No value on the even parity is present
                     add_to_schedule(activity_description,
-                                    (*time, 1) if cell_obj.alignment.horizontal in ['left', None] else time,
+                                    (*time, 1) if left_aligned else time,
                                     activity_groups)
 
         logger.debug(' - Identified activities: ' + '\n'.join([str(item) for item in schedule]))
@@ -275,10 +328,10 @@ class SheetParser:
         table_corner = None
         for col in range(1, 10):
             for row in range(1, 30):
-                if self.sheet[self.xlc((row, col))].value \
-                        and self.sheet[self.xlc((row, col))].value.upper() == 'ZIUA' \
-                        and self.sheet[self.xlc((row, col + 1))].value \
-                        and self.sheet[self.xlc((row, col + 1))].value.upper() == 'ORA':
+                day_header = self.cell_at((row, col)).value
+                hour_header = self.cell_at((row, col + 1)).value
+                if day_header and day_header.upper() == 'ZIUA' \
+                        and hour_header and hour_header.upper() == 'ORA':
                     table_corner = (row, col)
                     break
             if table_corner:
@@ -295,6 +348,8 @@ class SheetParser:
 
         # Identify table headers
         row_hours = self.identify_row_hours(cell)
+        if not row_hours:
+            return None
         groups = self.identify_student_groups(table_corner)
 
         schedule = self.identify_activities((cell[0], cell[1] + 1, max(row_hours.keys()), groups[-1][2]),
@@ -305,7 +360,8 @@ class SheetParser:
 
 def parse_timetable(file):
     logger.info('Parsing timetable: ' + file)
-    wb = load_workbook(file)
+    # read_only is not used: read-only sheets do not expose the merged cells needed for the borders
+    wb = load_workbook(file, data_only=True, keep_links=False)
 
     # Extract the series name from the timetable filename
     series_name = os.path.split(file)[1] \
@@ -317,12 +373,12 @@ def parse_timetable(file):
     schedule = []
     if len(wb.sheetnames) == 1:
         # single sheet corresponding to the series defined in the file name
-        schedule = schedule + SheetParser(wb[wb.sheetnames[0]], series_name).parse()
+        schedule.extend(SheetParser(wb[wb.sheetnames[0]], series_name).parse() or [])
     else:
         # multiple series grouped in the same Excel file
         for sheetname in wb.sheetnames:
             complete_series_name = (series_name + "-" + sheetname).replace(' ', '')
-            schedule = schedule + SheetParser(wb[sheetname], complete_series_name).parse()
+            schedule.extend(SheetParser(wb[sheetname], complete_series_name).parse() or [])
 
     return schedule
 
@@ -340,35 +396,38 @@ def export_schedule_rdf(schedule):
     _ = Namespace(base)
     rdf_graph.bind('', _)
 
+    # The triples are collected and added to the graph in bulk
+    triples = []
     for activity in schedule:
         # Create a unique identifier for the activity
-        act_id = URIRef(base + re.sub(r'\s', '_', f'{activity["id"] or ""}_{activity["time"][0]}-{activity["time"][1]}'
-                                                  f'_{activity["groups"][0][0]}-{activity["groups"][0][1]}'))
-        rdf_graph.add((act_id, RDF.type, _.Activity))
+        act_id = URIRef(base + SPACE_REGEX.sub('_', f'{activity["id"] or ""}_{activity["time"][0]}-{activity["time"][1]}'
+                                                    f'_{activity["groups"][0][0]}-{activity["groups"][0][1]}'))
+        triples.append((act_id, RDF.type, _.Activity))
 
-        rdf_graph.add((act_id, _.id, Literal(activity["id"])))
-        rdf_graph.add((act_id, _.name, Literal(activity["title"])))
-        rdf_graph.add((act_id, _.type, Literal(activity["type"])))
+        triples.append((act_id, _.id, Literal(activity["id"])))
+        triples.append((act_id, _.name, Literal(activity["title"])))
+        triples.append((act_id, _.type, Literal(activity["type"])))
 
         time = BNode()
-        rdf_graph.add((time, _.day, Literal(activity["time"][0])))
-        rdf_graph.add((time, _.time, Literal(f'{activity["time"][1].zfill(2)}:00:00', datatype=XSD.time)))
-        rdf_graph.add((time, _.duration, Literal(f'PT{activity["time"][2]}H', datatype=XSD.duration)))
-        rdf_graph.add((act_id, _.timeSlot, time))
+        triples.append((time, _.day, Literal(activity["time"][0])))
+        triples.append((time, _.time, Literal(f'{activity["time"][1].zfill(2)}:00:00', datatype=XSD.time)))
+        triples.append((time, _.duration, Literal(f'PT{activity["time"][2]}H', datatype=XSD.duration)))
+        triples.append((act_id, _.timeSlot, time))
 
         for (group, semigroup) in activity['groups']:
             group_node = BNode()
-            rdf_graph.add((group_node, _.group, Literal(group)))
-            rdf_graph.add((group_node, _.semigroup, Literal(semigroup or 0)))
-            rdf_graph.add((act_id, _.groups, group_node))
-        rdf_graph.add((act_id, _.series, Literal(activity['series'])))
+            triples.append((group_node, _.group, Literal(group)))
+            triples.append((group_node, _.semigroup, Literal(semigroup or 0)))
+            triples.append((act_id, _.groups, group_node))
+        triples.append((act_id, _.series, Literal(activity['series'])))
 
         for room in activity['room']:
             room_node = URIRef(base + room)
-            rdf_graph.add((act_id, _.room, room_node))
+            triples.append((act_id, _.room, room_node))
 
         for teacher in activity['teacher']:
-            rdf_graph.add((act_id, _.teacher, Literal(teacher)))
+            triples.append((act_id, _.teacher, Literal(teacher)))
+    rdf_graph.addN((subject, predicate, obj, rdf_graph) for subject, predicate, obj in triples)
 
     with codecs.open("../../kb/schedule.ttl", "w", "utf-8") as rdf_file:
         # Add a description of the data
@@ -384,10 +443,14 @@ def export_schedule_rdf(schedule):
 
 
 def parse_schedule_dir():
-    all_schedules = []
     with os.scandir('timetables/') as files:
-        for timetable_file in files:
-            all_schedules += parse_timetable(timetable_file.path)
+        timetable_paths = [timetable_file.path for timetable_file in files]
+
+    # The timetables are independent, so they are parsed in parallel (one process per file)
+    all_schedules = []
+    with ProcessPoolExecutor() as executor:
+        for schedule in executor.map(parse_timetable, timetable_paths):
+            all_schedules.extend(schedule)
 
     export_schedule_rdf(all_schedules)
 
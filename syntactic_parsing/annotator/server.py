@@ -1,20 +1,86 @@
 """
 Server for accessing spaCy's NLU features from a web application.
 """
+import functools
+import gzip
+import itertools
 import json
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pathlib
+import threading
 
 import spacy
 from spacy import displacy
 
-nlp = spacy.load("ro")
+# Only the pipes that are used are loaded: the tags and the dependencies for displaCy
+# and the dependencies for checking the complexity of the pending sentences
+nlp = spacy.load("ro", disable=["ner"])
 
 dir = pathlib.Path(__file__).parent.resolve()
-spacy_syntactic = spacy.load(dir / "../../models/spacy-syntactic-parser")
+spacy_syntactic = spacy.load(dir / "../../models/spacy-syntactic-parser", disable=["tagger", "ner"])
+ROOT_DEP = spacy_syntactic.vocab.strings["ROOT"]
 
 PORT_NUMBER = 3333
 
+EXAMPLES_PATH = dir / "../data/t.json"
+PENDING_SENTENCES_PATH = dir / "../data/pending_sentences.txt"
+PENDING_SENTENCES_SAVE_INTERVAL = 100
+
+DISPLACY_OPTIONS = {"add_lemma": True, "compact": True, "fine_grained": False}
+
+
+def load_examples():
+    with open(EXAMPLES_PATH, encoding='utf-8') as examples_file:
+        examples = examples_file.read()
+    return json.loads(examples) if examples else []
+
+
+def write_file(path, text):
+    # Written next to the file and then renamed, so that a crash never leaves it half-written
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding='utf-8') as tmp_file:
+        tmp_file.write(text)
+    os.replace(tmp_path, path)
+
+
+def accepts_gzip(accept_encoding):
+    # The quality of gzip, or of '*' when gzip is not listed, must be above 0
+    qualities = {}
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities.get('gzip', qualities.get('*', 0.0)) > 0
+
+
+@functools.lru_cache(maxsize=1024)
+def render_dependencies(phrase):
+    # Cached, the same phrases are rendered again while they are annotated
+    doc = nlp(phrase)
+    html_dep = displacy.render(doc, style="dep", page=True, options=DISPLACY_OPTIONS).encode()
+    return html_dep, gzip.compress(html_dep, compresslevel=1)
+
+
+# The annotated examples and the pending sentences are kept in memory (the files are only rewritten)
+examples = load_examples()
+annotated_sentences = {example[0] for example in examples}
+with open(PENDING_SENTENCES_PATH, encoding='utf-8') as sentences_file:
+    pending_sentences = sentences_file.read().split("\n")
+# The picks of /next are saved every PENDING_SENTENCES_SAVE_INTERVAL picks and at shutdown. The ones
+# lost in a crash are offered again, unless they were stored in the meantime.
+pending_sentences_picks = itertools.count(1)
+
+# Requests are served concurrently, the annotation data is updated by one request at a time
+data_lock = threading.Lock()
+
 
 class RequestHandler(BaseHTTPRequestHandler):
     def do_OPTIONS(self):
@@ -25,54 +91,58 @@ class RequestHandler(BaseHTTPRequestHandler):
         self.end_headers()
 
     def parse(self, phrase):
-        doc = nlp(phrase)
-
-        options = {"add_lemma": True, "compact": True, "fine_grained": False}
-        html_dep = displacy.render(doc, style="dep", page=True, options=options)
+        html_dep, gzipped_html_dep = render_dependencies(phrase)
 
         self.send_response(200)
         self.send_header('Content-type', 'text/html')
         self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Vary', 'Accept-Encoding')
+        if accepts_gzip(self.headers.get('Accept-Encoding', '')):
+            html_dep = gzipped_html_dep
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(html_dep)))
         self.end_headers()
-        self.wfile.write(str.encode(html_dep))
+        self.wfile.write(html_dep)
 
     def store(self, new_example):
-        with open(dir / "../data/t.json", encoding='utf-8') as examples_file:
-            examples = examples_file.read()
-        examples = json.loads(examples) if examples else []
-
-        examples.append(json.loads(new_example))
-        print(examples)
+        with data_lock:
+            examples.append(json.loads(new_example))
+            annotated_sentences.add(examples[-1][0])
+            num_examples = len(examples)
 
-        with open(dir / "../data/t.json", "w", encoding='utf-8') as examples_file:
-            examples_file.write(json.dumps(examples, ensure_ascii=False))
+            write_file(EXAMPLES_PATH, json.dumps(examples, ensure_ascii=False))
 
         self.send_response(200)
         self.send_header('Content-type', 'text/plain')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(str.encode(str(len(examples))))
+        self.wfile.write(str.encode(str(num_examples)))
 
     @staticmethod
-    def _is_complex(sentence):
-        doc = spacy_syntactic(sentence)
-        return len([token for token in doc if token.dep_ == "ROOT"]) == 1 and len(doc) >= 3
+    def _is_complex(doc):
+        if len(doc) < 3:
+            return False
+        # Stop at the second root, comparing the ids of the dependency labels
+        roots = 0
+        for token in doc:
+            if token.dep == ROOT_DEP:
+                roots += 1
+                if roots > 1:
+                    return False
+        return roots == 1
 
     def do_GET(self):
         if self.path == "/next":
-            with open(dir / "../data/pending_sentences.txt") as sentences_file:
-                sentences = sentences_file.read().split("\n")
+            with data_lock:
+                # The candidates are parsed in small batches, until the first complex one
+                # (this runs under the lock, so little is parsed past that one)
+                candidates = [s for s in pending_sentences if s not in annotated_sentences]
+                docs = spacy_syntactic.pipe(candidates, batch_size=8)
+                next_sentence = next(s for s, doc in zip(candidates, docs) if self._is_complex(doc))
+                pending_sentences[:] = filter(lambda s: s != next_sentence, pending_sentences)
 
-            with open(dir / "../data/t.json") as examples_file:
-                examples = examples_file.read()
-            examples = json.loads(examples)
-
-            annotated_sentences = map(lambda e: e[0], examples)
-            next_sentence = next(s for s in sentences if s not in annotated_sentences and self._is_complex(s))
-            pending_sentences = list(filter(lambda s: s != next_sentence, sentences))
-
-            with open(dir / "../data/pending_sentences.txt", "w") as sentences_file:
-                sentences_file.write("\n".join(pending_sentences))
+                if next(pending_sentences_picks) % PENDING_SENTENCES_SAVE_INTERVAL == 0:
+                    write_file(PENDING_SENTENCES_PATH, "\n".join(pending_sentences))
 
             self.send_response(200)
             self.send_header('Content-type', 'text/plain')
@@ -82,22 +152,25 @@ class RequestHandler(BaseHTTPRequestHandler):
 
     # Handler for the POST requests
     def do_POST(self):
-        content_len = int(self.headers.get('Content-Length'))
+        content_len = int(self.headers.get('Content-Length', 0))
         body = self.rfile.read(content_len)
-        data = body.decode("utf-8")
-
-        print(data)
 
         if self.path == "/dep":
-            self.parse(data)
+            self.parse(body.decode("utf-8"))
         elif self.path == "/store":
-            self.store(data)
+            # The example is loaded directly from the UTF-8 bytes
+            self.store(body)
         return
 
 
+# Warm up the models and displaCy, so that the first requests do not pay for their lazy initialization
+displacy.render(nlp("Acesta este un text de încălzire."), style="dep", page=True, options=DISPLACY_OPTIONS)
+spacy_syntactic("Acesta este un text de încălzire.")
+
 try:
     # Create a web server and define the handler to manage the incoming request
-    server = HTTPServer(('', PORT_NUMBER), RequestHandler)
+    # (one thread per request, so that the parses of concurrent requests are not queued)
+    server = ThreadingHTTPServer(('', PORT_NUMBER), RequestHandler)
     print('Started httpserver on port ', PORT_NUMBER)
 
     # Wait forever for incoming htto requests
@@ -105,3 +178,5 @@ try:
 
 except KeyboardInterrupt:
     server.socket.close()
+    with data_lock:
+        write_file(PENDING_SENTENCES_PATH, "\n".join(pending_sentences))
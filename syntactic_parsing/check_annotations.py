@@ -0,0 +1,51 @@
+# coding: utf-8
+"""
+Check the manual syntactic annotations used by the syntactic featurizers of the agent
+(components/syntactic_deps.json): every sentence must have exactly one known syntactic
+question (label) per token, as tokenized by the syntactic spaCy model.
+Run it after editing the annotations, the featurizers rely on this at runtime.
+"""
+
+import json
+import sys
+
+import spacy
+
+from utils import TermColors
+
+with open("dependencies.txt") as dependencies_file:
+    dependency_types = set(map(lambda line: line.strip(), dependencies_file.readlines()))
+
+with open("../components/syntactic_deps.json", encoding="utf-8") as annotations_file:
+    annotations = json.load(annotations_file)
+
+
+def check_annotations(nlp):
+    """ Print the annotations that do not match their sentence and return their number. """
+
+    errors = 0
+    texts = list(annotations.keys())
+    docs = nlp.tokenizer.pipe(map(lambda text: text.lower(), texts))
+    for text, doc in zip(texts, docs):
+        sentence_deps = annotations[text]
+        unknown_deps = [dep for dep in sentence_deps if dep not in dependency_types]
+        if len(doc) != len(sentence_deps) or unknown_deps:
+            errors += 1
+            print(TermColors.RED, text, TermColors.ENDC)
+            print(f'  tokens: {[token.text for token in doc]}')
+            print(f'  labels: {sentence_deps}')
+            if unknown_deps:
+                print(TermColors.YELLOW, f' unknown labels: {unknown_deps}', TermColors.ENDC)
+
+    print(f"{len(texts) - errors}/{len(texts)} annotations match their sentence")
+    return errors
+
+
+def main():
+    nlp = spacy.load('../models/spacy-syntactic')
+    if check_annotations(nlp):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -93,9 +93,10 @@ def train(model=None, n_iter=30):
     # nlp.add_pipe(parser, first=True)
     parser = [pipe for (name, pipe) in nlp.pipeline if name == "parser"][0]
 
-    for text, annotations in train_data:
-        for dep in annotations.get("deps", []):
-            parser.add_label(dep)
+    # add each label once (in the order of first occurrence, as the label order is part of the model)
+    labels = dict.fromkeys(itertools.chain.from_iterable(annotations.get("deps", []) for _, annotations in train_data))
+    for dep in labels:
+        parser.add_label(dep)
 
     pipe_exceptions = ["parser", "trf_wordpiecer", "trf_tok2vec"]
     other_pipes = [pipe for pipe in nlp.pipe_names if pipe not in pipe_exceptions]
@@ -134,11 +135,19 @@ def dep_span(doc, token, span_level=0):
 
 
 def print_parsing_result(doc):
+    # many tokens share the same head, so the spans are computed once per (token, span level)
+    spans = {}
+
+    def span(token, span_level):
+        if (token.i, span_level) not in spans:
+            spans[token.i, span_level] = dep_span(doc, token, span_level)
+        return spans[token.i, span_level]
+
     for token in doc:
         if token.dep_ != "-" and token.dep_ != 'prep':
             print(TermColors.YELLOW, token.dep_, TermColors.ENDC,
-                  f'[{dep_span(doc, token.head, 0)}] ->',
-                  TermColors.RED, dep_span(doc, token, 2), TermColors.ENDC)
+                  f'[{span(token.head, 0)}] ->',
+                  TermColors.RED, span(token, 2), TermColors.ENDC)
 
 
 def test_model(nlp, interactive=False):
@@ -169,13 +178,13 @@ def test_model(nlp, interactive=False):
             doc = nlp(phrase)
             print_parsing_result(doc)
     else:
-        docs = nlp.pipe(conv_agent_test_sentences)
+        docs = nlp.pipe(conv_agent_test_sentences, batch_size=64)
         for doc in docs:
             print('\n', doc.text)
             print_parsing_result(doc)
 
         # show a visual result as a web page with the help of displacy
-        docs = [nlp(phrase) for phrase in texts]
+        docs = list(nlp.pipe(texts, batch_size=64))
         options = {"add_lemma": False, "compact": True, "fine_grained": False}
 
         html_dep = displacy.render(docs, style="dep", page=True, options=options)
@@ -205,11 +214,10 @@ def evaluate_model(nlp):
     num_deps = {dep: 0 for dep in dependency_types}
 
     # parse sentences
-    docs = nlp.pipe(map(lambda s: s[0], test_data))
+    docs = nlp.pipe(map(lambda s: s[0], test_data), batch_size=64)
 
     # evaluate predictions
-    for i, doc in enumerate(docs):
-        true_sentence_deps = test_data[i][1]
+    for (_, true_sentence_deps), doc in zip(test_data, docs):
 
         # evaluate dependencies (syntactic questions) prediction
         sentence_deps_true = true_sentence_deps['deps']